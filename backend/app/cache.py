@@ -0,0 +1,107 @@
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from functools import wraps
+import os
+import time
+
+import orjson
+import redis
+from pydantic import parse_obj_as
+from sqlalchemy.exc import OperationalError
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+pool = redis.ConnectionPool.from_url(REDIS_URL)
+client = redis.Redis(connection_pool=pool)
+
+# Seconds until a cached body goes stale, per policy
+POLICIES = {
+    "short": 5,
+    "normal": 20,
+    "long": 60,
+}
+
+# Stale entries are kept this much longer so reads can fall back to the
+# last known good body if the database is unavailable
+STALE_GRACE = 300
+
+
+def _make_key(prefix, kwargs):
+    parts = [
+        f"{name}={value}"
+        for name, value in sorted(kwargs.items())
+        if isinstance(value, (str, int, float, bool, type(None)))
+    ]
+    return f"{prefix}:{':'.join(parts)}"
+
+
+def _cached_response(entry):
+    return Response(
+        content=entry[b"body"],
+        status_code=int(entry[b"status"]),
+        media_type="application/json",
+    )
+
+
+def cached(prefix, policy="normal", response_model=None):
+    """Cache an endpoint's JSON body in Redis, keyed by its query params.
+
+    Fresh entries are served directly without touching the database.
+    Entries past their stale_at are only served if regenerating them
+    fails because the database is down.
+
+    Because the wrapper returns a prebuilt Response, FastAPI's own
+    response_model handling is bypassed; pass the endpoint's schema as
+    response_model here so the cached body is filtered through it and
+    keeps the documented shape. Schemas validated against ORM objects
+    must set orm_mode, as parse_obj_as reads their attributes directly.
+    """
+    ttl = POLICIES[policy]
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(prefix, kwargs)
+            try:
+                entry = client.hgetall(key)
+            except redis.RedisError:
+                entry = None
+
+            now = time.time()
+            if entry and float(entry[b"stale_at"]) > now:
+                return _cached_response(entry)
+
+            try:
+                result = func(*args, **kwargs)
+            except OperationalError:
+                if entry:
+                    return _cached_response(entry)
+                raise
+
+            if response_model is not None:
+                result = parse_obj_as(response_model, result)
+            body = orjson.dumps(jsonable_encoder(result))
+            try:
+                client.hset(key, mapping={
+                    "generated_at": now,
+                    "stale_at": now + ttl,
+                    "body": body,
+                    "status": 200,
+                })
+                client.expire(key, ttl + STALE_GRACE)
+            except redis.RedisError:
+                pass
+
+            return Response(content=body, media_type="application/json")
+        return wrapper
+    return decorator
+
+
+def invalidate(*prefixes):
+    """Drop all cached entries under the given key prefixes"""
+    try:
+        for prefix in prefixes:
+            for key in client.scan_iter(match=f"{prefix}:*"):
+                client.delete(key)
+    except redis.RedisError:
+        pass
@@ -0,0 +1,188 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, raiseload
+from datetime import datetime, timedelta
+import numpy as np
+import os
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+from . import models
+
+# When set, any relationship that was not explicitly eager-loaded raises
+# instead of silently issuing an extra SELECT, so accidental N+1 patterns
+# fail loudly in development instead of shipping
+STRICT_LAZY_LOADING = os.getenv("STRICT_LAZY_LOADING", "").lower() in ("1", "true", "yes")
+
+
+def _guard_lazy_loads(query):
+    if STRICT_LAZY_LOADING:
+        return query.options(raiseload("*"))
+    return query
+
+
+_STATUS_LOOKUP = np.array([
+    models.StockStatus.CRITICAL,
+    models.StockStatus.WARNING,
+    models.StockStatus.NORMAL
+], dtype=object)
+
+
+def classify_stock_statuses(quantities, min_quantities):
+    """Vectorized equivalent of the stock_status thresholds for bulk paths
+
+    Classifies whole arrays at once with broadcast comparisons, so the
+    per-item work runs in NumPy's compiled loops instead of Python.
+    """
+    quantities = np.asarray(quantities, dtype=np.float64)
+    min_quantities = np.asarray(min_quantities, dtype=np.float64)
+    codes = np.select(
+        [quantities <= 0, quantities <= min_quantities * 1.5],
+        [0, 1],
+        default=2
+    )
+    return _STATUS_LOOKUP[codes]
+
+
+def _days_remaining_numpy(quantities, avg_daily_usage):
+    has_usage = avg_daily_usage > 0
+    out = np.full(quantities.shape[0], 30.0)
+    np.divide(quantities, avg_daily_usage, out=out, where=has_usage)
+    out[has_usage & (quantities <= 0)] = 0.0
+    return out
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _days_remaining(quantities, avg_daily_usage):
+        out = np.empty(quantities.shape[0])
+        for i in prange(quantities.shape[0]):
+            rate = avg_daily_usage[i]
+            if rate <= 0:
+                out[i] = 30.0
+            elif quantities[i] <= 0:
+                out[i] = 0.0
+            else:
+                out[i] = quantities[i] / rate
+        return out
+
+    # Trigger the JIT compile at import so the first prediction request
+    # doesn't pay the multi-second compilation cost
+    _days_remaining(np.zeros(1), np.zeros(1))
+else:
+    _days_remaining = _days_remaining_numpy
+
+
+def get_inventory_item(db: Session, item_id: int):
+    return db.query(models.InventoryItem).filter(models.InventoryItem.id == item_id).first()
+
+
+def get_inventory_items(db: Session, skip: int = 0, limit: int = None):
+    """Fetch inventory items with their supplier and warehouse eagerly joined
+
+    The report and alert paths touch item.supplier.name and
+    item.warehouse.name for every row, so loading them in the same
+    query avoids two extra SELECTs per item.
+    """
+    query = db.query(models.InventoryItem).options(
+        joinedload(models.InventoryItem.supplier),
+        joinedload(models.InventoryItem.warehouse)
+    ).order_by(models.InventoryItem.id).offset(skip)
+    if limit is not None:
+        query = query.limit(limit)
+    return _guard_lazy_loads(query).all()
+
+
+def create_inventory_item(db: Session, item, user_id: int):
+    db_item = models.InventoryItem(**item.dict(), created_by_id=user_id)
+    db.add(db_item)
+    db.commit()
+    db.refresh(db_item)
+    return db_item
+
+
+def create_stock_movement(db: Session, movement, user_id: int):
+    db_movement = models.StockMovement(**movement.dict(), user_id=user_id)
+
+    item = get_inventory_item(db, item_id=movement.item_id)
+    if item is None:
+        raise ValueError(f"Inventory item {movement.item_id} not found")
+
+    if movement.movement_type == "in":
+        item.current_quantity += movement.quantity
+    elif movement.movement_type == "out":
+        item.current_quantity = max(0.0, item.current_quantity - movement.quantity)
+    else:  # adjustment
+        item.current_quantity = movement.quantity
+
+    db.add(db_movement)
+    db.commit()
+    db.refresh(db_movement)
+    return db_movement
+
+
+def get_stock_alerts(db: Session, status=None, supplier_id: int = None, warehouse_id: int = None):
+    query = db.query(models.InventoryItem).options(
+        joinedload(models.InventoryItem.warehouse)
+    ).filter(models.InventoryItem.stock_status != models.StockStatus.NORMAL)
+    if status is not None:
+        query = query.filter(models.InventoryItem.stock_status == status)
+    if supplier_id is not None:
+        query = query.filter(models.InventoryItem.supplier_id == supplier_id)
+    if warehouse_id is not None:
+        query = query.filter(models.InventoryItem.warehouse_id == warehouse_id)
+    query = _guard_lazy_loads(query)
+
+    return [
+        {
+            "item_id": item.id,
+            "item_name": item.name,
+            "current_quantity": item.current_quantity,
+            "min_quantity": item.min_quantity,
+            "status": item.stock_status,
+            "warehouse": item.warehouse.name if item.warehouse else None
+        }
+        for item in query.all()
+    ]
+
+
+def calculate_shortage_predictions(db: Session, days_lookback: int = 30):
+    """Predict shortage dates for all items from their recent outbound usage"""
+    cutoff = datetime.utcnow() - timedelta(days=days_lookback)
+    items = get_inventory_items(db)
+
+    usage_by_item = dict(
+        db.query(
+            models.StockMovement.item_id,
+            func.sum(models.StockMovement.quantity)
+        ).filter(
+            models.StockMovement.movement_type == "out",
+            models.StockMovement.created_at >= cutoff
+        ).group_by(models.StockMovement.item_id).all()
+    )
+
+    quantities = np.array([item.current_quantity for item in items], dtype=np.float64)
+    min_quantities = np.array([item.min_quantity for item in items], dtype=np.float64)
+    usage_totals = np.array([usage_by_item.get(item.id, 0.0) for item in items], dtype=np.float64)
+    avg_daily_usage = usage_totals / days_lookback
+    statuses = classify_stock_statuses(quantities, min_quantities)
+
+    # Same rules as InventoryItem.predict_shortage_date, over all items at
+    # once: no usage -> 30 days out, already empty -> today, otherwise
+    # current quantity divided by daily burn rate
+    days_remaining = _days_remaining(quantities, avg_daily_usage)
+
+    now = datetime.utcnow()
+    return [
+        {
+            "item_id": item.id,
+            "item_name": item.name,
+            "current_quantity": item.current_quantity,
+            "status": statuses[i],
+            "avg_daily_usage": float(avg_daily_usage[i]),
+            "predicted_shortage_date": now + timedelta(days=float(days_remaining[i]))
+        }
+        for i, item in enumerate(items)
+    ]
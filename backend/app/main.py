@@ -1,22 +1,33 @@
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import List, Optional
-import pandas as pd
+import io
 
-from . import models, schemas, crud, auth
-from .database import SessionLocal, engine
+from . import models, schemas, crud, auth, cache
+from .database import DATABASE_URL, SessionLocal, engine
 from .config import settings
 
 
 models.Base.metadata.create_all(bind=engine)
 
+# create_all skips tables that already exist, so databases created before
+# the movement index was added never get it; create it explicitly
+with engine.begin() as connection:
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_stock_movements_item_id_created_at "
+        "ON stock_movements (item_id, created_at)"
+    ))
+
 app = FastAPI(
     title="Raw Material Stock Monitor API",
     description="API for monitoring raw material stock levels in manufacturing",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -48,9 +59,12 @@ async def root():
 
 @app.post("/api/items/", response_model=schemas.InventoryItem, status_code=status.HTTP_201_CREATED)
 def create_item(item: schemas.InventoryItemCreate, db: Session = Depends(get_db), current_user: models.User = Depends(auth.get_current_active_user)):
-    return crud.create_inventory_item(db=db, item=item, user_id=current_user.id)
+    db_item = crud.create_inventory_item(db=db, item=item, user_id=current_user.id)
+    cache.invalidate("items", "alerts", "predictions")
+    return db_item
 
 @app.get("/api/items/", response_model=List[schemas.InventoryItem])
+@cache.cached("items", policy="short", response_model=List[schemas.InventoryItem])
 def read_items(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     items = crud.get_inventory_items(db, skip=skip, limit=limit)
     return items
@@ -64,9 +78,12 @@ def read_item(item_id: int, db: Session = Depends(get_db)):
 
 @app.post("/api/stock-movements/", response_model=schemas.StockMovement, status_code=status.HTTP_201_CREATED)
 def create_stock_movement(movement: schemas.StockMovementCreate, db: Session = Depends(get_db), current_user: models.User = Depends(auth.get_current_active_user)):
-    return crud.create_stock_movement(db=db, movement=movement, user_id=current_user.id)
+    db_movement = crud.create_stock_movement(db=db, movement=movement, user_id=current_user.id)
+    cache.invalidate("items", "alerts", "predictions")
+    return db_movement
 
 @app.get("/api/stock-alerts/", response_model=List[schemas.StockAlert])
+@cache.cached("alerts", policy="normal", response_model=List[schemas.StockAlert])
 def get_stock_alerts(
     status: Optional[models.StockStatus] = None, 
     supplier_id: Optional[int] = None,
@@ -80,6 +97,29 @@ def get_stock_alerts(
         warehouse_id=warehouse_id
     )
 
+_CSV_HEADER = "id,name,sku,current_quantity,min_quantity,status,warehouse,supplier\r\n"
+
+def _csv_field(value):
+    if value is None:
+        return ""
+    value = str(value)
+    if '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    if "," in value or "\n" in value or "\r" in value:
+        return f'"{value}"'
+    return value
+
+# Row template compiled once at import time; each row then renders as a
+# single f-string evaluation instead of a csv.writer call
+_CSV_ROW_SOURCE = (
+    "lambda item, q=_csv_field: ("
+    "f'{item.id},{q(item.name)},{q(item.sku)},"
+    "{item.current_quantity},{item.min_quantity},{item.stock_status.value},"
+    "{q(item.warehouse.name if item.warehouse else None)},"
+    "{q(item.supplier.name if item.supplier else None)}\\r\\n')"
+)
+_csv_row = eval(_CSV_ROW_SOURCE, {"_csv_field": _csv_field})
+
 @app.get("/api/reports/stock-levels/")
 def generate_stock_levels_report(
     format: str = "json",
@@ -88,22 +128,53 @@ def generate_stock_levels_report(
     items = crud.get_inventory_items(db)
     
     if format == "csv":
-        df = pd.DataFrame([{
-            'id': item.id,
-            'name': item.name,
-            'sku': item.sku,
-            'current_quantity': item.current_quantity,
-            'min_quantity': item.min_quantity,
-            'status': item.stock_status.value,
-            'warehouse': item.warehouse.name if item.warehouse else None,
-            'supplier': item.supplier.name if item.supplier else None
-        } for item in items])
-        
-        return {"content": df.to_csv(index=False), "media_type": "text/csv"}
-    
+        def generate_csv():
+            yield _CSV_HEADER
+            chunk = []
+            for item in items:
+                chunk.append(_csv_row(item))
+                if len(chunk) >= 1000:
+                    yield "".join(chunk)
+                    chunk.clear()
+            if chunk:
+                yield "".join(chunk)
+
+        return StreamingResponse(generate_csv(), media_type="text/csv")
+
+    if format in ("parquet", "feather"):
+        import pyarrow as pa
+
+        table = pa.table({
+            'id': [item.id for item in items],
+            'name': [item.name for item in items],
+            'sku': [item.sku for item in items],
+            'current_quantity': [item.current_quantity for item in items],
+            'min_quantity': [item.min_quantity for item in items],
+            'status': [item.stock_status.value for item in items],
+            'warehouse': [item.warehouse.name if item.warehouse else None for item in items],
+            'supplier': [item.supplier.name if item.supplier else None for item in items]
+        })
+
+        buffer = io.BytesIO()
+        if format == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, buffer)
+            media_type = "application/vnd.apache.parquet"
+        else:
+            import pyarrow.feather as feather
+            feather.write_feather(table, buffer)
+            media_type = "application/vnd.apache.arrow.file"
+
+        return Response(
+            content=buffer.getvalue(),
+            media_type=media_type,
+            headers={"Content-Disposition": f"attachment; filename=stock_levels.{format}"}
+        )
+
     return items
 
 @app.get("/api/predictions/shortage-dates/")
+@cache.cached("predictions", policy="long")
 def predict_shortage_dates(
     days_lookback: int = 30,
     db: Session = Depends(get_db)
@@ -112,5 +183,16 @@ def predict_shortage_dates(
     return crud.calculate_shortage_predictions(db, days_lookback=days_lookback)
 
 if __name__ == "__main__":
+    import multiprocessing
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # SQLite serializes writers even with WAL, so don't fan out worker
+    # processes against it unless explicitly asked to
+    default_workers = 1 if "sqlite" in DATABASE_URL else multiprocessing.cpu_count()
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", default_workers)),
+        loop="auto"
+    )
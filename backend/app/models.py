@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Boolean, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Boolean, Index, case, func, type_coerce
+from sqlalchemy.orm import column_property, relationship
 from datetime import datetime, timedelta
 from .database import Base
 import enum
@@ -80,23 +80,28 @@ class InventoryItem(Base):
     warehouse_id = Column(Integer, ForeignKey("warehouses.id", ondelete="SET NULL"), nullable=True)
     created_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    s
-    supplier = relationship("Supplier", back_populates="inventory_items")
-    warehouse = relationship("Warehouse", back_populates="inventory_items")
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    # Stock status computed by the database alongside the row rather than
+    # per-access in Python, so it can also be filtered on in queries
+    stock_status = column_property(
+        type_coerce(
+            case(
+                (current_quantity <= 0, StockStatus.CRITICAL.name),
+                (current_quantity <= min_quantity * 1.5, StockStatus.WARNING.name),
+                else_=StockStatus.NORMAL.name
+            ),
+            Enum(StockStatus)
+        )
+    )
+
+    supplier = relationship("Supplier", back_populates="inventory_items", lazy="joined")
+    warehouse = relationship("Warehouse", back_populates="inventory_items", lazy="joined")
     created_by = relationship("User", back_populates="inventory_items")
     stock_movements = relationship("StockMovement", back_populates="item")
-    
-    @property
-    def stock_status(self) -> StockStatus:
-        """Calculate stock status based on current and minimum quantity"""
-        if self.current_quantity <= 0:
-            return StockStatus.CRITICAL
-        elif self.current_quantity <= self.min_quantity * 1.5:  
-            return StockStatus.WARNING
-        return StockStatus.NORMAL
-    
+
+
     def predict_shortage_date(self, avg_daily_usage: float = None) -> datetime:
         """
         Predict when the stock will run out based on average daily usage
@@ -113,7 +118,12 @@ class InventoryItem(Base):
 
 class StockMovement(Base):
     __tablename__ = "stock_movements"
-    
+    __table_args__ = (
+        # Covers the shortage-prediction aggregation, which filters by item
+        # and recent created_at
+        Index("ix_stock_movements_item_id_created_at", "item_id", "created_at"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     movement_type = Column(String, nullable=False) 
     quantity = Column(Float, nullable=False)
@@ -123,7 +133,7 @@ class StockMovement(Base):
     item_id = Column(Integer, ForeignKey("inventory_items.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    
+    created_at = Column(DateTime, server_default=func.now())
+
     item = relationship("InventoryItem", back_populates="stock_movements")
     user = relationship("User", back_populates="stock_movements")
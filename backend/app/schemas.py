@@ -0,0 +1,85 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+from .models import MaterialCategory, StockStatus, UnitType
+
+
+class InventoryItemBase(BaseModel):
+    name: str
+    description: Optional[str] = None
+    sku: Optional[str] = None
+    category: MaterialCategory
+    unit: UnitType
+    current_quantity: float = 0.0
+    min_quantity: float = 0.0
+    reorder_quantity: Optional[float] = None
+    unit_cost: float = 0.0
+    supplier_id: Optional[int] = None
+    warehouse_id: Optional[int] = None
+
+
+class InventoryItemCreate(InventoryItemBase):
+    pass
+
+
+class InventoryItem(InventoryItemBase):
+    id: int
+    stock_status: StockStatus
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+
+class StockMovementBase(BaseModel):
+    item_id: int
+    movement_type: str  # 'in', 'out', 'adjustment'
+    quantity: float
+    reference: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class StockMovementCreate(StockMovementBase):
+    pass
+
+
+class StockMovement(StockMovementBase):
+    id: int
+    user_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+
+class StockAlert(BaseModel):
+    item_id: int
+    item_name: str
+    current_quantity: float
+    min_quantity: float
+    status: StockStatus
+    warehouse: Optional[str] = None
+
+
+class UserBase(BaseModel):
+    email: str
+    full_name: Optional[str] = None
+
+
+class UserCreate(UserBase):
+    password: str
+
+
+class User(UserBase):
+    id: int
+    is_active: bool
+
+    class Config:
+        orm_mode = True
+
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
@@ -1,87 +1,84 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.responses import Response
+import msgspec
 from datetime import datetime, timedelta
 from enum import Enum
-import json
-import os
-
-DB_FILE = "stock_monitor_db.json"
-
-if not os.path.exists(DB_FILE):
-    sample_data = {
-        "inventory_items": [
-            {
-                "id": 1,
-                "name": "Steel Sheets",
-                "sku": "STL-001",
-                "current_quantity": 150,
-                "min_quantity": 50,
-                "unit": "pc",
-                "supplier": "MetalWorks Inc.",
-                "warehouse": "Main Warehouse"
-            },
-            {
-                "id": 2,
-                "name": "Plastic Pellets",
-                "sku": "PLA-001",
-                "current_quantity": 500,
-                "min_quantity": 200,
-                "unit": "kg",
-                "supplier": "Plastico",
-                "warehouse": "Main Warehouse"
-            }
-        ],
-        "stock_movements": []
-    }
-    with open(DB_FILE, 'w') as f:
-        json.dump(sample_data, f)
-
-def load_db():
-    with open(DB_FILE, 'r') as f:
-        return json.load(f)
-
-def save_db(data):
-    with open(DB_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+import sqlite3
+
+
+class MsgspecJSONResponse(Response):
+    """JSON response rendered by msgspec's C encoder"""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return msgspec.json.encode(content)
+
+DB_FILE = "stock_monitor_db.sqlite3"
+
+conn = sqlite3.connect(DB_FILE, isolation_level=None, check_same_thread=False)
+conn.row_factory = sqlite3.Row
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
+
+conn.executescript("""
+CREATE TABLE IF NOT EXISTS inventory_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    sku TEXT NOT NULL,
+    current_quantity REAL NOT NULL DEFAULT 0,
+    min_quantity REAL NOT NULL DEFAULT 0,
+    unit TEXT NOT NULL,
+    supplier TEXT NOT NULL,
+    warehouse TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stock_movements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_id INTEGER NOT NULL REFERENCES inventory_items(id),
+    quantity REAL NOT NULL,
+    movement_type TEXT NOT NULL,
+    notes TEXT,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_stock_movements_item_id ON stock_movements(item_id);
+""")
+
+if conn.execute("SELECT COUNT(*) FROM inventory_items").fetchone()[0] == 0:
+    sample_items = [
+        (1, "Steel Sheets", "STL-001", 150, 50, "pc", "MetalWorks Inc.", "Main Warehouse"),
+        (2, "Plastic Pellets", "PLA-001", 500, 200, "kg", "Plastico", "Main Warehouse")
+    ]
+    conn.executemany(
+        "INSERT INTO inventory_items (id, name, sku, current_quantity, min_quantity, unit, supplier, warehouse) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        sample_items
+    )
+
+# Process-local cache of the full item list; reads reuse it until a write
+# marks it dirty, so back-to-back GETs don't rescan the table
+_items_cache = None
+
+def _all_items():
+    global _items_cache
+    if _items_cache is None:
+        rows = conn.execute("SELECT * FROM inventory_items ORDER BY id").fetchall()
+        _items_cache = [dict(row) for row in rows]
+    return _items_cache
+
+def _mark_items_dirty():
+    global _items_cache
+    _items_cache = None
 
 class StockStatus(str, Enum):
     NORMAL = "green"
     WARNING = "yellow"
     CRITICAL = "red"
 
-class InventoryItem(BaseModel):
-    id: int
-    name: str
-    sku: str
-    current_quantity: float
-    min_quantity: float
-    unit: str
-    supplier: str
-    warehouse: str
-    
-    @property
-    def status(self) -> StockStatus:
-        if self.current_quantity <= 0:
-            return StockStatus.CRITICAL
-        elif self.current_quantity <= self.min_quantity * 1.5:
-            return StockStatus.WARNING
-        return StockStatus.NORMAL
-
-class StockMovement(BaseModel):
-    id: int
-    item_id: int
-    quantity: float
-    movement_type: str  # 'in', 'out', 'adjustment'
-    reference: Optional[str] = None
-    notes: Optional[str] = None
-    timestamp: datetime = datetime.utcnow()
-
 app = FastAPI(
     title="Raw Material Stock Monitor",
     description="Simple API for monitoring raw material stock levels",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=MsgspecJSONResponse
 )
 
 app.add_middleware(
@@ -96,70 +93,72 @@ app.add_middleware(
 async def root():
     return {"message": "Welcome to Raw Material Stock Monitor API", "docs": "/docs"}
 
-@app.get("/api/items/", response_model=List[dict])
+@app.get("/api/items/")
 async def get_items():
-    db = load_db()
-    return db["inventory_items"]
+    return _all_items()
 
-@app.get("/api/items/{item_id}", response_model=dict)
+@app.get("/api/items/{item_id}")
 async def get_item(item_id: int):
-    db = load_db()
-    for item in db["inventory_items"]:
-        if item["id"] == item_id:
-            return item
-    raise HTTPException(status_code=404, detail="Item not found")
+    row = conn.execute("SELECT * FROM inventory_items WHERE id = ?", (item_id,)).fetchone()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return dict(row)
 
 @app.post("/api/items/{item_id}/update-quantity")
 async def update_quantity(item_id: int, quantity: float, movement_type: str = "adjustment", notes: str = None):
-    db = load_db()
-    item_found = False
-    
-    for item in db["inventory_items"]:
-        if item["id"] == item_id:
-            item_found = True
-            if movement_type == "in":
-                item["current_quantity"] += quantity
-            elif movement_type == "out":
-                item["current_quantity"] = max(0, item["current_quantity"] - quantity)
-            else:  # adjustment
-                item["current_quantity"] = quantity
-            break
-    
-    if not item_found:
+    if movement_type == "in":
+        cursor = conn.execute(
+            "UPDATE inventory_items SET current_quantity = current_quantity + ? WHERE id = ?",
+            (quantity, item_id)
+        )
+    elif movement_type == "out":
+        cursor = conn.execute(
+            "UPDATE inventory_items SET current_quantity = MAX(0, current_quantity - ?) WHERE id = ?",
+            (quantity, item_id)
+        )
+    else:  # adjustment
+        cursor = conn.execute(
+            "UPDATE inventory_items SET current_quantity = ? WHERE id = ?",
+            (quantity, item_id)
+        )
+
+    if cursor.rowcount == 0:
         raise HTTPException(status_code=404, detail="Item not found")
-    
-    movement_id = max([m.get("id", 0) for m in db["stock_movements"]], default=0) + 1
-    db["stock_movements"].append({
-        "id": movement_id,
-        "item_id": item_id,
-        "quantity": quantity,
-        "movement_type": movement_type,
-        "notes": notes,
-        "timestamp": datetime.utcnow().isoformat()
-    })
-    
-    save_db(db)
+
+    conn.execute(
+        "INSERT INTO stock_movements (item_id, quantity, movement_type, notes, timestamp) VALUES (?, ?, ?, ?, ?)",
+        (item_id, quantity, movement_type, notes, datetime.utcnow().isoformat())
+    )
+
+    _mark_items_dirty()
     return {"message": "Quantity updated successfully"}
 
 @app.get("/api/stock-alerts/")
 async def get_stock_alerts():
-    db = load_db()
     alerts = []
-    
-    for item in db["inventory_items"]:
-        item_obj = InventoryItem(**item)
-        if item_obj.status != StockStatus.NORMAL:
-            alerts.append({
-                "item_id": item_obj.id,
-                "item_name": item_obj.name,
-                "current_quantity": item_obj.current_quantity,
-                "min_quantity": item_obj.min_quantity,
-                "status": item_obj.status,
-                "warehouse": item_obj.warehouse
-            })
-    
+
+    # Rows come straight from our own table, so classify them with plain
+    # comparisons instead of validating each through a Pydantic model
+    for item in _all_items():
+        quantity = item["current_quantity"]
+        if quantity <= 0:
+            status = StockStatus.CRITICAL
+        elif quantity <= item["min_quantity"] * 1.5:
+            status = StockStatus.WARNING
+        else:
+            continue
+        alerts.append({
+            "item_id": item["id"],
+            "item_name": item["name"],
+            "current_quantity": quantity,
+            "min_quantity": item["min_quantity"],
+            "status": status,
+            "warehouse": item["warehouse"]
+        })
+
     return alerts
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Single worker: the in-memory item cache is process-local
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto")
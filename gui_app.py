@@ -1,10 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+import atexit
 import json
+import queue
+import threading
 from datetime import datetime
 from enum import Enum
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DB_FILE = "stock_monitor_db.json"
 
 if not os.path.exists(DB_FILE):
@@ -53,8 +61,18 @@ class StockMonitorApp:
         self.main_frame = ttk.Frame(root, padding="10")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
         
+        self.row_iids = {}
+
+        # One persistent writer thread consumes queued payloads in order,
+        # so saves can't race each other, and the atexit flush makes sure
+        # the last save reaches disk before the process exits
+        self._save_queue = queue.Queue()
+        self._writer_thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer_thread.start()
+        atexit.register(self._flush_pending_saves)
+
         self.create_widgets()
-        
+
         self.load_data()
         self.update_inventory_list()
     
@@ -132,20 +150,73 @@ class StockMonitorApp:
     
     def load_data(self):
         try:
-            with open(DB_FILE, 'r') as f:
-                self.data = json.load(f)
+            with open(DB_FILE, 'rb') as f:
+                raw = f.read()
+            self.data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load data: {str(e)}")
             self.data = {"inventory_items": [], "stock_movements": []}
+
+        # Seed monotonic id counters once instead of scanning every record
+        # each time a new id is needed
+        self.next_item_id = max((item["id"] for item in self.data["inventory_items"]), default=0) + 1
+        self.next_movement_id = max((m.get("id", 0) for m in self.data["stock_movements"]), default=0) + 1
     
     def save_data(self):
+        # Serialize on the main thread (cheap), then hand the disk write to
+        # the writer thread so the UI never blocks on I/O
         try:
-            with open(DB_FILE, 'w') as f:
-                json.dump(self.data, f, indent=2)
-            return True
+            if orjson is not None:
+                payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.data, indent=2).encode("utf-8")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {str(e)}")
             return False
+
+        self._save_queue.put(payload)
+        return True
+
+    def _write_loop(self):
+        while True:
+            payload = self._save_queue.get()
+            shutting_down = payload is None
+            # Collapse a burst of saves into the newest pending payload
+            while True:
+                try:
+                    pending = self._save_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    shutting_down = True
+                else:
+                    payload = pending
+            if payload is not None:
+                self._write_payload(payload)
+            if shutting_down:
+                return
+
+    def _write_payload(self, payload):
+        try:
+            tmp_file = DB_FILE + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, DB_FILE)
+        except Exception as e:
+            try:
+                self.root.after(
+                    0,
+                    lambda: messagebox.showerror("Error", f"Failed to save data: {str(e)}")
+                )
+            except tk.TclError:
+                # Window already gone; nothing left to report to
+                pass
+
+    def _flush_pending_saves(self):
+        self._save_queue.put(None)
+        self._writer_thread.join(timeout=10)
     
     def get_stock_status(self, current, min_qty):
         if current <= 0:
@@ -155,23 +226,40 @@ class StockMonitorApp:
         return StockStatus.NORMAL
     
     def update_inventory_list(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for item in self.data["inventory_items"]:
-            status = self.get_stock_status(item["current_quantity"], item["min_quantity"])
-            
-            self.tree.insert("", tk.END, values=(
-                item["id"],
-                item["name"],
-                item["sku"],
-                f"{item['current_quantity']:.2f}",
-                f"{item['min_quantity']:.2f}",
-                item["unit"],
-                status.value.upper(),
-                item["supplier"],
-                item["warehouse"]
-            ), tags=(status.value,))
-        
+        items = self.data["inventory_items"]
+        current_ids = {item["id"] for item in items}
+
+        # Hide the columns while mutating rows so Tk doesn't recompute
+        # geometry on every insert, then restore them in one go
+        self.tree.configure(displaycolumns=())
+        try:
+            for item_id in list(self.row_iids):
+                if item_id not in current_ids:
+                    self.tree.delete(self.row_iids.pop(item_id))
+
+            for item in items:
+                status = self.get_stock_status(item["current_quantity"], item["min_quantity"])
+                values = (
+                    item["id"],
+                    item["name"],
+                    item["sku"],
+                    f"{item['current_quantity']:.2f}",
+                    f"{item['min_quantity']:.2f}",
+                    item["unit"],
+                    status.value.upper(),
+                    item["supplier"],
+                    item["warehouse"]
+                )
+                iid = self.row_iids.get(item["id"])
+                if iid is None:
+                    self.row_iids[item["id"]] = self.tree.insert(
+                        "", tk.END, values=values, tags=(status.value,)
+                    )
+                else:
+                    self.tree.item(iid, values=values, tags=(status.value,))
+        finally:
+            self.tree.configure(displaycolumns="#all")
+
         self.tree.tag_configure("red", background='#ffdddd')
         self.tree.tag_configure("yellow", background='#ffffcc')
         self.tree.tag_configure("green", background='#ddffdd')
@@ -213,8 +301,9 @@ class StockMonitorApp:
         
         def save_item():
             try:
-                item_id = max([item["id"] for item in self.data["inventory_items"]], default=0) + 1
-                
+                item_id = self.next_item_id
+                self.next_item_id += 1
+
                 new_item = {
                     "id": item_id,
                     "name": name_entry.get(),
@@ -278,7 +367,8 @@ class StockMonitorApp:
                 else:  
                     item["current_quantity"] = qty
                 
-                movement_id = max([m.get("id", 0) for m in self.data["stock_movements"]], default=0) + 1
+                movement_id = self.next_movement_id
+                self.next_movement_id += 1
                 self.data["stock_movements"].append({
                     "id": movement_id,
                     "item_id": item_id,